@@ -25,6 +25,7 @@ To fix bugs, fix in the googlesource repo then run the autoroller.
 # pylint: disable=wrong-import-position
 import argparse
 import errno
+import functools
 import json
 import logging
 import os
@@ -53,22 +54,19 @@ class MalformedRecipesCfg(Exception):
     super().__init__(full_message)
 
 
-def parse(repo_root, recipes_cfg_path):
-  """Parse is a lightweight a recipes.cfg file parser.
+@functools.lru_cache(maxsize=32)
+def _parse_uncached(recipes_cfg_path, mtime_ns):
+  """Parses recipes.cfg without resolving paths against the repo root.
 
-  Args:
-    repo_root (str) - native path to the root of the repo we're trying to run
-      recipes for.
-    recipes_cfg_path (str) - native path to the recipes.cfg file to process.
+  `mtime_ns` is only used as part of the cache key, so that an edited
+  recipes.cfg is re-read.
 
   Returns (as tuple):
-    engine_dep (EngineDep|None): The recipe_engine dependency, or None, if the
-      current repo IS the recipe_engine.
-    recipes_path (str) - native path to where the recipes live inside of the
-      current repo (i.e. the folder containing `recipes/` and/or
-      `recipe_modules`)
+    engine_dep (EngineDep|None): see `parse`.
+    recipes_path (str) - the `recipes_path` value from recipes.cfg, as written.
   """
-  with open(recipes_cfg_path, 'r', encoding='utf-8') as file:
+  del mtime_ns  # only part of the cache key
+  with open(recipes_cfg_path, 'rb') as file:
     recipes_cfg = json.load(file)
 
   try:
@@ -98,19 +96,45 @@ def parse(repo_root, recipes_cfg_path):
     if not engine['branch'].startswith('refs/'):
       engine['branch'] = 'refs/heads/' + engine['branch']
 
-    recipes_path = os.path.join(repo_root,
-                                recipes_path.replace('/', os.path.sep))
     return EngineDep(**engine), recipes_path
   except KeyError as ex:
     raise MalformedRecipesCfg(str(ex), recipes_cfg_path) from ex
 
 
+def parse(repo_root, recipes_cfg_path):
+  """Parse is a lightweight a recipes.cfg file parser.
+
+  Results are cached per (recipes_cfg_path, mtime), so repeated calls in the
+  same process don't re-read the file.
+
+  Args:
+    repo_root (str) - native path to the root of the repo we're trying to run
+      recipes for.
+    recipes_cfg_path (str) - native path to the recipes.cfg file to process.
+
+  Returns (as tuple):
+    engine_dep (EngineDep|None): The recipe_engine dependency, or None, if the
+      current repo IS the recipe_engine.
+    recipes_path (str) - native path to where the recipes live inside of the
+      current repo (i.e. the folder containing `recipes/` and/or
+      `recipe_modules`)
+  """
+  mtime_ns = os.stat(recipes_cfg_path).st_mtime_ns
+  engine_dep, recipes_path = _parse_uncached(recipes_cfg_path, mtime_ns)
+  if engine_dep is None:
+    return None, recipes_path
+  recipes_path = os.path.join(repo_root,
+                              recipes_path.replace('/', os.path.sep))
+  return engine_dep, recipes_path
+
+
 IS_WIN = sys.platform.startswith(('win', 'cygwin'))
 
 _BAT = '.bat' if IS_WIN else ''
 GIT = 'git' + _BAT
 CIPD = 'cipd' + _BAT
-REQUIRED_BINARIES = {GIT, CIPD}
+VPYTHON = 'vpython3' + _BAT
+REQUIRED_BINARIES = {GIT, CIPD, VPYTHON}
 
 
 def _is_executable(path):
@@ -128,12 +152,35 @@ def _git_check_call(argv, **kwargs):
   subprocess.check_call(argv, **kwargs)
 
 
+def _git_popen(argv, **kwargs):
+  argv = [GIT] + argv
+  logging.info('Running %r', argv)
+  return subprocess.Popen(argv, **kwargs)
+
+
 def _git_output(argv, **kwargs):
   argv = [GIT] + argv
   logging.info('Running %r', argv)
   return subprocess.check_output(argv, **kwargs)
 
 
+def _find_repo_root(start):
+  """Walks up from `start` looking for a directory containing
+  infra/config/recipes.cfg.
+
+  Returns the native path to that directory, or None if the filesystem root is
+  reached without finding one.
+  """
+  path = start
+  while True:
+    if os.path.isfile(os.path.join(path, 'infra', 'config', 'recipes.cfg')):
+      return path
+    parent = os.path.dirname(path)
+    if parent == path:
+      return None
+    path = parent
+
+
 def parse_args(argv):
   """This extracts a subset of the arguments that this bootstrap script cares
   about. Currently this consists of:
@@ -177,19 +224,28 @@ def checkout_engine(engine_path, repo_root, recipes_cfg_path):
     # Note: this logic mirrors the logic in recipe_engine/fetch.py
     _git_check_call(['init', engine_path], stdout=subprocess.DEVNULL)
 
-    try:
-      _git_check_call(['rev-parse', '--verify', f'{revision}^{{commit}}'],
+    # Both probes are read-only, so run them concurrently; on the warm path
+    # (revision present and checked out) neither fetch nor reset is needed.
+    verify = _git_popen(['rev-parse', '--verify', f'{revision}^{{commit}}'],
+                        cwd=engine_path,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL)
+    diff = _git_popen(['diff', '--quiet', revision],
                       cwd=engine_path,
                       stdout=subprocess.DEVNULL,
                       stderr=subprocess.DEVNULL)
-    except subprocess.CalledProcessError:
+    have_revision = verify.wait() == 0
+    is_clean = diff.wait() == 0
+
+    if not have_revision:
       _git_check_call(['fetch', '--quiet', url, branch],
                       cwd=engine_path,
                       stdout=subprocess.DEVNULL)
+      # The diff above ran against a missing revision, so its result is
+      # meaningless; a freshly fetched revision always needs a reset.
+      is_clean = False
 
-    try:
-      _git_check_call(['diff', '--quiet', revision], cwd=engine_path)
-    except subprocess.CalledProcessError:
+    if not is_clean:
       index_lock = os.path.join(engine_path, '.git', 'index.lock')
       try:
         os.remove(index_lock)
@@ -197,11 +253,15 @@ def checkout_engine(engine_path, repo_root, recipes_cfg_path):
         if exc.errno != errno.ENOENT:
           logging.warning('failed to remove %r, reset will fail: %s',
                           index_lock, exc)
-      _git_check_call(['reset', '-q', '--hard', revision], cwd=engine_path)
+      _git_check_call(['reset', '-q', '--hard', revision],
+                      cwd=engine_path,
+                      stdout=subprocess.DEVNULL)
 
     # If the engine has refactored/moved modules we need to clean all .pyc files
     # or things will get squirrely.
-    _git_check_call(['clean', '-qxf'], cwd=engine_path)
+    _git_check_call(['clean', '-qxf'],
+                    cwd=engine_path,
+                    stdout=subprocess.DEVNULL)
 
   return engine_path
 
@@ -222,19 +282,18 @@ def main():
     repo_root = os.path.dirname(
         os.path.dirname(os.path.dirname(recipes_cfg_path)))
   else:
-    # find repo_root with git and calculate recipes_cfg_path
-    repo_root = (
-        _git_output(['rev-parse', '--show-toplevel'],
-                    cwd=os.path.abspath(os.path.dirname(__file__))).strip())
-    repo_root = os.path.abspath(repo_root).decode()
+    # find repo_root by walking up from this script (falling back to git) and
+    # calculate recipes_cfg_path
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = _find_repo_root(script_dir)
+    if repo_root is None:
+      repo_root = (
+          _git_output(['rev-parse', '--show-toplevel'], cwd=script_dir).strip())
+      repo_root = os.path.abspath(repo_root).decode()
     recipes_cfg_path = os.path.join(repo_root, 'infra', 'config', 'recipes.cfg')
     args = ['--package', recipes_cfg_path] + args
   engine_path = checkout_engine(engine_override, repo_root, recipes_cfg_path)
 
-  vpython = 'vpython3' + _BAT
-  if not shutil.which(vpython):
-    return f'Required binary is not found on PATH: {vpython}'
-
   # We unset PYTHONPATH here in case the user has conflicting environmental
   # things we don't want them to leak through into the recipe_engine which
   # manages its environment entirely via vpython.
@@ -251,7 +310,7 @@ def main():
     spec = '.vscode.vpython3'
 
   argv = ([
-      vpython,
+      VPYTHON,
       '-vpython-spec',
       os.path.join(engine_path, spec),
       '-u',